@@ -0,0 +1,41 @@
+"""Add composite indexes for task listings
+
+Revision ID: 002_task_composite_indexes
+Revises: 001_initial
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_task_composite_indexes'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Developer task list: filter by assignee, optionally by status, newest first
+    op.create_index(
+        'ix_tasks_assigned_to_id_status', 'tasks',
+        ['assigned_to_id', 'status', sa.text('created_at DESC'), sa.text('id DESC')], unique=False
+    )
+    
+    # Project Manager task list: filter by status, newest first (id breaks ties)
+    op.create_index(
+        'ix_tasks_status_created_at', 'tasks',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')], unique=False
+    )
+    
+    # Project Manager task list without a status filter: newest first
+    op.create_index(
+        'ix_tasks_created_at', 'tasks',
+        [sa.text('created_at DESC'), sa.text('id DESC')], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_status_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_id_status', table_name='tasks')
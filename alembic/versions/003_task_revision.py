@@ -0,0 +1,29 @@
+"""Add task revision counter for list ETags
+
+Revision ID: 003_task_revision
+Revises: 002_task_composite_indexes
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_task_revision'
+down_revision = '002_task_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Single row advanced by every task write
+    task_revision = op.create_table('task_revision',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(task_revision, [{'id': 1, 'value': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('task_revision')
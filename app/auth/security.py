@@ -1,43 +1,110 @@
 """
 Authentication utilities and security functions
 """
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import List, Optional, Tuple
+import bcrypt
+from cachetools import TLRUCache
+from jose import JWTError, jwk, jwt
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models import User, UserRole
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Verified against when the user does not exist, so a miss costs as much as a hit
+_DUMMY_HASH = bcrypt.hashpw(b"!", bcrypt.gensalt(settings.bcrypt_rounds))
 
+# Role set for require_role membership checks
+ALL_ROLES = frozenset({UserRole.BACKEND_DEVELOPER, UserRole.PROJECT_MANAGER})
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+def _token_expiry(key: bytes, payload: dict, now: float) -> float:
+    """
+    Expire cached token payloads at the token's own ``exp`` claim
+    """
+    return payload["exp"]
+
+
+# User lookups built and cached by SQLAlchemy once, then reused with new parameters
+_USER_BY_ID = lambda_stmt(lambda: select(User).where(User.id == bindparam("user_id")))
+_USER_BY_USERNAME = lambda_stmt(
+    lambda: select(User).where(User.username == bindparam("username"))
+)
+
+# Signing key and algorithm list prepared once instead of on every call
+_SIGNING_KEY = jwk.construct(settings.secret_key, algorithm=settings.algorithm)
+_ALGORITHMS = [settings.algorithm]
+
+
+# Validated token payloads keyed by a digest of the raw token
+_token_cache = TLRUCache(maxsize=10_000, ttu=_token_expiry, timer=time.time)
+_token_cache_lock = threading.Lock()
+
+
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
     """
     Verify a password against its hash
+
+    A missing hash is checked against a dummy one and always fails, so the
+    caller pays the same bcrypt cost either way.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    password = plain_password.encode("utf-8")
+    if hashed_password is None:
+        bcrypt.checkpw(password, _DUMMY_HASH)
+        return False
+    return bcrypt.checkpw(password, hashed_password.encode("utf-8"))
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a password
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def bulk_hash_passwords(passwords: List[str]) -> List[str]:
+    """
+    Hash many passwords at once (e.g. user imports), one process per core
+    """
+    if not passwords:
+        return []
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(get_password_hash, passwords, chunksize=chunksize))
+
+
+def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
+    """
+    Fetch a user by primary key
+    """
+    return db.execute(_USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
+
+
+def get_user_by_username(db: Session, username: str) -> Optional[User]:
+    """
+    Fetch a user by username
+    """
+    return db.execute(_USER_BY_USERNAME, {"username": username}).scalar_one_or_none()
 
 
 def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
     """
     Authenticate user with username and password
     """
-    user = db.query(User).filter(User.username == username).first()
-    if not user:
-        return None
-    if not verify_password(password, user.hashed_password):
+    user = get_user_by_username(db, username)
+    # Always hash, so unknown usernames are not revealed by timing
+    password_ok = verify_password(password, user.hashed_password if user else None)
+    if user is None or not password_ok:
         return None
     return user
 
@@ -48,29 +115,41 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = expires_delta.total_seconds()
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        lifetime = settings.access_token_expire_minutes * 60
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    # jose accepts a POSIX timestamp for exp directly
+    to_encode["exp"] = int(time.time() + lifetime)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.algorithm)
     return encoded_jwt
 
 
 def decode_token(token: str) -> Optional[dict]:
     """
-    Decode JWT token
+    Decode JWT token, reusing the payload of tokens verified earlier
     """
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _token_cache_lock:
+        payload = _token_cache.get(cache_key)
+    if payload is not None:
         return payload
+    
+    try:
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
     except JWTError:
         return None
+    
+    # Only tokens carrying an expiry can be cached safely
+    if "exp" in payload:
+        with _token_cache_lock:
+            _token_cache[cache_key] = payload
+    return payload
 
 
-def get_current_user_info(token: str) -> dict:
+def get_current_user_info(token: str) -> Tuple[str, str]:
     """
-    Extract user information from JWT token
+    Extract (user_id, role) from JWT token
     """
     payload = decode_token(token)
     if not payload:
@@ -89,10 +168,10 @@ def get_current_user_info(token: str) -> dict:
             detail="Invalid token payload"
         )
     
-    return {"user_id": user_id, "role": role}
+    return user_id, role
 
 
-def require_role(user_role: str, required_roles: list) -> bool:
+def require_role(user_role: str, required_roles: frozenset) -> bool:
     """
     Check if user has required role
     """
@@ -126,15 +205,4 @@ def get_access_denied_exception() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
         detail="Access denied"
-    )
-
-
-# Role-based access control decorators (for FastAPI dependencies)
-def is_project_manager(role: str) -> bool:
-    """Check if user is project manager"""
-    return role == UserRole.PROJECT_MANAGER
-
-
-def is_backend_developer(role: str) -> bool:
-    """Check if user is backend developer"""
-    return role == UserRole.BACKEND_DEVELOPER
\ No newline at end of file
+    )
\ No newline at end of file
@@ -10,11 +10,22 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./taskflow.db"
+    skip_create_all: bool = False
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout_seconds: int = 10
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
     
     # Security
     secret_key: str = "your-super-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12
+    
+    # Caching
+    user_cache_ttl_seconds: int = 30
+    task_list_cache_ttl_seconds: int = 15
     
     # API
     api_version: str = "1.0.0"
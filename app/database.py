@@ -1,17 +1,54 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+import hashlib
+
+from sqlalchemy import Column, MetaData, String, Table, create_engine, event, make_url, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from app.config import settings
 
+_database_url = make_url(settings.database_url)
+_is_sqlite = _database_url.get_backend_name() == "sqlite"
+
+# Larger compiled-statement cache so every hot query stays compiled
+engine_options = {"query_cache_size": 1200}
+if _is_sqlite:
+    engine_options["connect_args"] = {"check_same_thread": False}
+elif settings.database_url.startswith("postgresql+psycopg:"):
+    # psycopg 3 server-side prepared statements break behind PgBouncer
+    # in transaction pooling mode
+    engine_options["connect_args"] = {"prepare_threshold": None}
+if _is_sqlite and _database_url.database in (None, "", ":memory:"):
+    # An in-memory database only exists on its one connection
+    engine_options["poolclass"] = StaticPool
+else:
+    engine_options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping
+    )
+
 # Create engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False}  # Only needed for SQLite
-)
+engine = create_engine(settings.database_url, **engine_options)
+
+
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Use WAL journaling so readers do not block on the writer
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -19,6 +56,70 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for models
 Base = declarative_base()
 
+# Digest of the DDL the tables were last created from, kept outside Base.metadata
+_marker_metadata = MetaData()
+schema_marker = Table(
+    "_schema_marker", _marker_metadata,
+    Column("value", String(64), primary_key=True)
+)
+
+
+def _schema_digest() -> str:
+    """
+    Hash the DDL of every mapped table and index
+    """
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=engine.dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            ddl.append(str(CreateIndex(index).compile(dialect=engine.dialect)))
+    return hashlib.sha256("".join(ddl).encode("utf-8")).hexdigest()
+
+
+def create_tables():
+    """
+    Create missing tables, skipping the work when the schema is unchanged
+    """
+    if settings.skip_create_all:
+        return
+    
+    digest = _schema_digest()
+    with engine.connect() as conn:
+        try:
+            current = conn.execute(select(schema_marker.c.value)).scalar()
+        except SQLAlchemyError:
+            # Marker table not created yet
+            current = None
+    if current == digest:
+        return
+    
+    Base.metadata.create_all(bind=engine)
+    try:
+        with engine.begin() as conn:
+            _marker_metadata.create_all(conn)
+            conn.execute(schema_marker.delete())
+            conn.execute(schema_marker.insert().values(value=digest))
+    except IntegrityError:
+        # Another worker booting at the same time wrote the marker first;
+        # that is only fine if it recorded this same schema
+        with engine.connect() as conn:
+            if conn.execute(select(schema_marker.c.value)).scalar() != digest:
+                raise
+
+
+def pool_status() -> dict:
+    """
+    Connection pool usage for the health check
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0)
+    }
+
 
 def get_db():
     """
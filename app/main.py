@@ -1,14 +1,15 @@
 """
 Main FastAPI application for Taskflow API
 """
+import asyncio
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
-from app.database import engine, Base
+from app.database import create_tables, pool_status
 from app.routers import auth, tasks
-from app.models import User, Task, UserRole
+from app.models import User, Task, TaskRevision, UserRole
 from app.auth.security import get_password_hash
 from app.config import settings
 
@@ -19,8 +20,8 @@ async def lifespan(app: FastAPI):
     Application lifespan events
     """
     # Startup
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+    # Create tables (no-op when the schema marker is current)
+    create_tables()
     
     # Seed initial data (for demo purposes)
     from sqlalchemy.orm import Session
@@ -31,12 +32,19 @@ async def lifespan(app: FastAPI):
         # Check if we need to create default users
         pm_count = db.query(User).filter(User.role == UserRole.PROJECT_MANAGER).count()
         if pm_count == 0:
+            # bcrypt releases the GIL, so both hashes run in parallel threads
+            loop = asyncio.get_running_loop()
+            pm_password, dev_password = await asyncio.gather(
+                loop.run_in_executor(None, get_password_hash, "pm123"),
+                loop.run_in_executor(None, get_password_hash, "dev123")
+            )
+            
             # Create default Project Manager
             pm_user = User(
                 username="project_manager",
                 email="pm@taskflow.com",
                 full_name="Project Manager",
-                hashed_password=get_password_hash("pm123"),
+                hashed_password=pm_password,
                 role=UserRole.PROJECT_MANAGER
             )
             db.add(pm_user)
@@ -46,13 +54,18 @@ async def lifespan(app: FastAPI):
                 username="backend_dev",
                 email="dev@taskflow.com",
                 full_name="Backend Developer",
-                hashed_password=get_password_hash("dev123"),
+                hashed_password=dev_password,
                 role=UserRole.BACKEND_DEVELOPER
             )
             db.add(dev_user)
             
             db.commit()
             print("Default users created successfully!")
+        
+        # Seed the task revision row that list ETags are keyed on
+        if db.get(TaskRevision, 1) is None:
+            db.add(TaskRevision(id=1, value=0))
+            db.commit()
     except Exception as e:
         print(f"Error seeding data: {e}")
         db.rollback()
@@ -71,6 +84,7 @@ app = FastAPI(
     description="A comprehensive task management API with role-based access control",
     version=settings.api_version,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -87,19 +101,20 @@ app.add_middleware(
 # Custom exception handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
             "error": True,
             "status_code": exc.status_code
-        }
+        },
+        headers=exc.headers
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -131,7 +146,8 @@ async def health_check():
     """
     return {
         "status": "healthy",
-        "version": settings.api_version
+        "version": settings.api_version,
+        "database_pool": pool_status()
     }
 
 
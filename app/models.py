@@ -1,52 +0,0 @@
-# 4. app/models.py
-
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Text, DateTime, Float
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from app.database import Base
-import enum
-
-class UserRole(str, enum.Enum):
-    DEVELOPER = "developer"
-    MANAGER = "manager"
-
-class TaskStatus(str, enum.Enum):
-    PENDING = "pending"
-    IN_PROGRESS = "in-progress"
-    COMPLETED = "completed"
-    BLOCKED = "blocked"
-
-class User(Base):
-    _tablename_ = "users"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), unique=True, index=True, nullable=False)
-    email = Column(String(100), unique=True, index=True, nullable=False)
-    full_name = Column(String(100), nullable=False)
-    hashed_password = Column(String(200), nullable=False)
-    role = Column(Enum(UserRole), default=UserRole.DEVELOPER, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
-    # Relationships
-    tasks = relationship("Task", back_populates="assignee", foreign_keys="Task.assignee_id")
-    created_tasks = relationship("Task", back_populates="creator", foreign_keys="Task.created_by")
-
-class Task(Base):
-    _tablename_ = "tasks"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(200), nullable=False)
-    description = Column(Text)
-    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
-    priority = Column(Integer, default=1)  # 1=Low, 2=Medium, 3=High, 4=Critical
-    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    due_date = Column(DateTime(timezone=True))
-    feedback = Column(Text)
-    score = Column(Float)
-    
-    # Relationships
-    assignee = relationship("User", back_populates="tasks", foreign_keys=[assignee_id])
-    creator = relationship("User", back_populates="created_tasks", foreign_keys=[created_by])
\ No newline at end of file
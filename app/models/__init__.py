@@ -1,7 +1,7 @@
 """
 Database models for Taskflow API
 """
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Enum, func
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Enum, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy import Enum as SQLEnum
 
@@ -14,6 +14,13 @@ class UserRole:
     PROJECT_MANAGER = "project_manager"
 
 
+# Role hierarchy; a permission check is a single integer comparison
+ROLE_LEVEL = {
+    UserRole.BACKEND_DEVELOPER: 1,
+    UserRole.PROJECT_MANAGER: 2,
+}
+
+
 class TaskStatus:
     """Task status enum"""
     TODO = "todo"
@@ -42,6 +49,11 @@ class User(Base):
     # Relationships
     tasks_created = relationship("Task", back_populates="creator", foreign_keys="Task.created_by_id")
     tasks_assigned = relationship("Task", back_populates="assignee", foreign_keys="Task.assigned_to_id")
+    
+    @property
+    def role_level(self) -> int:
+        """Position of the user's role in ROLE_LEVEL; 0 for an unknown role"""
+        return ROLE_LEVEL.get(self.role, 0)
 
 
 class Task(Base):
@@ -70,6 +82,38 @@ class Task(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
+    # Composite indexes for the developer (assignee + status) and PM
+    # (status, or unfiltered) listings, all newest first
+    __table_args__ = (
+        Index(
+            "ix_tasks_assigned_to_id_status",
+            assigned_to_id, status, created_at.desc(), id.desc()
+        ),
+        Index("ix_tasks_status_created_at", status, created_at.desc(), id.desc()),
+        Index("ix_tasks_created_at", created_at.desc(), id.desc()),
+    )
+    
     # Relationships
     creator = relationship("User", back_populates="tasks_created", foreign_keys=[created_by_id])
-    assignee = relationship("User", back_populates="tasks_assigned", foreign_keys=[assigned_to_id])
\ No newline at end of file
+    assignee = relationship("User", back_populates="tasks_assigned", foreign_keys=[assigned_to_id])
+    
+    @property
+    def creator_name(self) -> str:
+        """Full name of the user who created the task"""
+        return self.creator.full_name
+    
+    @property
+    def assignee_name(self) -> str:
+        """Full name of the user the task is assigned to"""
+        return self.assignee.full_name
+
+
+class TaskRevision(Base):
+    """
+    Single-row counter advanced in every task write transaction; list ETags
+    and cached list pages are keyed on its value
+    """
+    __tablename__ = "task_revision"
+    
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
\ No newline at end of file
@@ -1,48 +1,119 @@
 """
 Authentication router for Taskflow API
 """
+import threading
 from datetime import timedelta
+from types import SimpleNamespace
+from typing import Optional
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import exists, insert
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import User, UserRole
+from app.models import User
 from app.schemas.auth import (
     UserLogin, UserRegister, UserResponse, Token, PasswordChange
 )
 from app.auth.security import (
     authenticate_user, get_password_hash, create_access_token,
-    get_current_user_info
+    get_current_user_info, get_user_by_id, require_role, ALL_ROLES
 )
 from app.config import settings
 
+# Endpoints that hit the database or bcrypt are plain `def` so they run in
+# FastAPI's threadpool rather than blocking the event loop
 router = APIRouter(prefix="/auth", tags=["authentication"])
-security = HTTPBearer()
+# Missing credentials are handled in get_current_user, not by raising in FastAPI
+security = HTTPBearer(auto_error=False)
 
+# Canonical 401 responses, allocated once and re-raised on every failed auth
+_UNAUTH_NO_TOKEN = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Not authenticated",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_UNAUTH_BAD_CREDS = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Incorrect username or password",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_UNAUTH_INACTIVE = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Inactive user"
+)
+_UNAUTH_NO_USER = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="User not found"
+)
+
+# Constant part of every login response
+_TOKEN_TEMPLATE = {
+    "token_type": "bearer",
+    "expires_in": settings.access_token_expire_minutes * 60
+}
+
+# Short-lived identity cache so hot users skip the per-request lookup
+_user_cache = TTLCache(maxsize=10_000, ttl=settings.user_cache_ttl_seconds)
+_user_cache_lock = threading.Lock()
+
+
+def _load_user_cached(db: Session, user_id: int) -> Optional[SimpleNamespace]:
+    """
+    Load the identity fields of a user, served from memory while fresh
+    """
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+    
+    db_user = get_user_by_id(db, user_id)
+    if db_user is None:
+        return None
+    
+    user = SimpleNamespace(
+        id=db_user.id,
+        username=db_user.username,
+        email=db_user.email,
+        full_name=db_user.full_name,
+        role=db_user.role,
+        role_level=db_user.role_level,
+        is_active=db_user.is_active,
+        created_at=db_user.created_at
+    )
+    with _user_cache_lock:
+        _user_cache[user_id] = user
+    return user
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a user from the identity cache after their record changes
+    """
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+
+def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
 ):
     """
     Get current authenticated user
     """
-    token_info = get_current_user_info(credentials.credentials)
-    user_id = token_info["user_id"]
+    # Drop the previous raise's traceback so shared instances do not grow one
+    if credentials is None:
+        raise _UNAUTH_NO_TOKEN.with_traceback(None)
+    
+    user_id, _role = get_current_user_info(credentials.credentials)
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _load_user_cached(db, int(user_id))
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        raise _UNAUTH_NO_USER.with_traceback(None)
     
     if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Inactive user"
-        )
+        raise _UNAUTH_INACTIVE.with_traceback(None)
     
     return user
 
@@ -57,23 +128,16 @@ async def get_current_active_user(
 
 
 @router.post("/login", response_model=Token)
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """
     Authenticate user and return access token
     """
     user = authenticate_user(db, user_credentials.username, user_credentials.password)
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _UNAUTH_BAD_CREDS.with_traceback(None)
     
     if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Inactive user"
-        )
+        raise _UNAUTH_INACTIVE.with_traceback(None)
     
     access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
@@ -81,22 +145,19 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
         expires_delta=access_token_expires
     )
     
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "expires_in": settings.access_token_expire_minutes * 60
-    }
+    return {"access_token": access_token, **_TOKEN_TEMPLATE}
 
 
 @router.post("/register", response_model=UserResponse)
-async def register(user_data: UserRegister, db: Session = Depends(get_db)):
+def register(user_data: UserRegister, db: Session = Depends(get_db)):
     """
     Register new user
     """
-    # Check if username already exists
-    existing_user = db.query(User).filter(
-        (User.username == user_data.username) | (User.email == user_data.email)
-    ).first()
+    # Check if username or email already exists, one index seek each
+    existing_user = (
+        db.query(exists().where(User.username == user_data.username)).scalar()
+        or db.query(exists().where(User.email == user_data.email)).scalar()
+    )
     
     if existing_user:
         raise HTTPException(
@@ -105,32 +166,39 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
         )
     
     # Validate role
-    valid_roles = [UserRole.BACKEND_DEVELOPER, UserRole.PROJECT_MANAGER]
-    if user_data.role not in valid_roles:
+    if not require_role(user_data.role, ALL_ROLES):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid role specified"
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    db_user = User(
-        username=user_data.username,
-        email=user_data.email,
-        full_name=user_data.full_name,
-        hashed_password=hashed_password,
-        role=user_data.role
-    )
-    
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    user_values = {
+        "username": user_data.username,
+        "email": user_data.email,
+        "full_name": user_data.full_name,
+        "hashed_password": get_password_hash(user_data.password),
+        "role": user_data.role
+    }
+    if db.get_bind().dialect.insert_returning:
+        # RETURNING hands back id and created_at in the same round trip, so
+        # the response is built before commit expires the row
+        db_user = db.scalars(insert(User).returning(User), [user_values]).one()
+        user_response = UserResponse.model_validate(db_user)
+        db.commit()
+    else:
+        db_user = User(**user_values)
+        db.add(db_user)
+        db.commit()
+        db.refresh(db_user)
+        user_response = UserResponse.model_validate(db_user)
+    invalidate_cached_user(user_response.id)
     
-    return db_user
+    return user_response
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def read_current_user(current_user: User = Depends(get_current_user)):
     """
     Get current user information
     """
@@ -138,7 +206,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/change-password")
-async def change_password(
+def change_password(
     password_data: PasswordChange,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -148,15 +216,22 @@ async def change_password(
     """
     from app.auth.security import verify_password
     
-    # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    # The cached identity carries no password hash, so load the row itself
+    user = get_user_by_id(db, current_user.id)
+    
+    # Verify current password, hashing even if the row has since vanished
+    password_ok = verify_password(
+        password_data.current_password, user.hashed_password if user else None
+    )
+    if user is None or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
     # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    user.hashed_password = get_password_hash(password_data.new_password)
     db.commit()
+    invalidate_cached_user(user.id)
     
     return {"message": "Password updated successfully"}
\ No newline at end of file
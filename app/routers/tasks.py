@@ -1,27 +1,209 @@
 """
 Tasks router with role-based access control
 """
+import hashlib
+import threading
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import exists, func, or_, select, update
 
+from app.config import settings
 from app.database import get_db
-from app.models import User, Task, TaskStatus, UserRole
-from app.schemas.tasks import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
+from app.models import User, Task, TaskRevision, TaskStatus, UserRole, ROLE_LEVEL
+from app.schemas.tasks import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, build_task_response
+)
 from app.routers.auth import get_current_user
-from app.auth.security import is_project_manager, is_backend_developer, get_pm_required_exception
+from app.auth.security import get_pm_required_exception
 
 
+# Endpoints use the synchronous Session, so they are plain `def` and run in
+# FastAPI's threadpool rather than blocking the event loop. Read endpoints
+# return pre-serialized responses with response_model=None so FastAPI does
+# not validate the output a second time; their schemas stay in `responses`
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Load creator and assignee in the same SELECT as the task; anything else
+# lazy-loaded from a task raises instead of silently issuing a query
+TASK_LOAD_OPTIONS = (
+    joinedload(Task.creator),
+    joinedload(Task.assignee),
+    raiseload("*"),
+)
+
+# For the Project Manager list, creators and assignees are attached by
+# _load_task_users instead of joining two user rows onto every task row
+TASK_LIST_LOAD_OPTIONS = (
+    raiseload("*"),
+)
+
+# Minimum role levels for the two access tiers
+DEV_ROLE_LEVEL = ROLE_LEVEL[UserRole.BACKEND_DEVELOPER]
+PM_ROLE_LEVEL = ROLE_LEVEL[UserRole.PROJECT_MANAGER]
+
+# Allowed task status values, built once instead of per request
+VALID_TASK_STATUSES = frozenset({
+    TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED, TaskStatus.BLOCKED
+})
+VALID_STATUSES_LIST = sorted(VALID_TASK_STATUSES)
+
+# Dumps a page of tasks in a single call
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+
+# Serialized list pages. Keys include the task revision, so a page is never
+# served after a write; clearing on writes only frees the superseded pages
+_task_list_cache = TTLCache(maxsize=1024, ttl=settings.task_list_cache_ttl_seconds)
+_task_list_cache_lock = threading.Lock()
+
+
+def _task_list_cache_key(*parts) -> bytes:
+    """
+    Digest of the endpoint and parameters that identify a list page
+    """
+    return hashlib.blake2b("|".join(map(str, parts)).encode("utf-8"), digest_size=16).digest()
+
+
+def _get_cached_task_list(cache_key: bytes) -> Optional[Response]:
+    """
+    Return a cached list page as a ready-made JSON response
+    """
+    with _task_list_cache_lock:
+        body = _task_list_cache.get(cache_key)
+    if body is None:
+        return None
+    return Response(content=body, media_type="application/json")
+
+
+def _cache_task_list(cache_key: bytes, content: dict) -> Response:
+    """
+    Serialize a list page once with orjson, cache it and return it
+    """
+    response = ORJSONResponse(content)
+    with _task_list_cache_lock:
+        _task_list_cache[cache_key] = response.body
+    return response
+
+
+def _task_revision(db: Session) -> int:
+    """
+    Current task revision; read it before the page so the page is never
+    older than the revision it is cached and tagged under
+    """
+    return db.execute(
+        select(TaskRevision.value).where(TaskRevision.id == 1)
+    ).scalar() or 0
+
+
+def _bump_task_revision(db: Session) -> None:
+    """
+    Advance the task revision inside the current write transaction
+    """
+    result = db.execute(
+        update(TaskRevision)
+        .where(TaskRevision.id == 1)
+        .values(value=TaskRevision.value + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.add(TaskRevision(id=1, value=1))
+
+
+def _task_list_etag(cache_key: bytes) -> str:
+    """
+    Entity tag of a list page, derived from its revision-keyed cache key
+    """
+    return f'"{cache_key.hex()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether the client's If-None-Match already names this entity tag
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def invalidate_task_lists() -> None:
+    """
+    Drop all cached list pages after a task write; they are keyed on the old
+    revision and would only sit in memory until their TTL
+    """
+    with _task_list_cache_lock:
+        _task_list_cache.clear()
+
+
+def _task_to_response(task: Task) -> TaskResponse:
+    """
+    Convert a task, with creator and assignee loaded, to its response schema
+    """
+    return build_task_response(task)
+
+
+def _tasks_to_list_response(tasks: List[Task], total: int, page: int, per_page: int) -> dict:
+    """
+    Build the paginated list envelope; the whole page is dumped in one
+    pydantic-core call
+    """
+    task_responses = [build_task_response(task) for task in tasks]
+    return {
+        "tasks": _TASK_LIST_ADAPTER.dump_python(task_responses, mode="json"),
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": (total + per_page - 1) // per_page
+    }
+
+
+def _load_task_users(db: Session, tasks: List[Task]) -> None:
+    """
+    Batch-load the creators and assignees of a page of tasks with one
+    IN() query and attach them as if they had been eager loaded
+    """
+    user_ids = {task.created_by_id for task in tasks} | {task.assigned_to_id for task in tasks}
+    if not user_ids:
+        return
+    users = {
+        user.id: user
+        for user in db.execute(select(User).where(User.id.in_(user_ids))).scalars()
+    }
+    for task in tasks:
+        set_committed_value(task, "creator", users.get(task.created_by_id))
+        set_committed_value(task, "assignee", users.get(task.assigned_to_id))
+
+
+def _paginate(db: Session, stmt, page: int, per_page: int):
+    """
+    Fetch one page of tasks and the total match count. The count runs on
+    the tasks table alone so it can be answered from an index, and only
+    the page's rows are joined to their users
+    """
+    count_stmt = select(func.count()).select_from(Task)
+    if stmt.whereclause is not None:
+        count_stmt = count_stmt.where(stmt.whereclause)
+    total = db.execute(count_stmt).scalar_one()
+    
+    offset = (page - 1) * per_page
+    if offset >= total:
+        return [], total
+    tasks = db.execute(stmt.offset(offset).limit(per_page)).scalars().all()
+    return tasks, total
+
 
 # Dependency to check if user is Project Manager
 async def require_pm_role(current_user: User = Depends(get_current_user)):
     """
     Require Project Manager role
     """
-    if not is_project_manager(current_user.role):
+    if current_user.role_level < PM_ROLE_LEVEL:
         raise get_pm_required_exception()
     return current_user
 
@@ -31,7 +213,7 @@ async def require_dev_role(current_user: User = Depends(get_current_user)):
     """
     Require Backend Developer role (or any authenticated user)
     """
-    if not is_backend_developer(current_user.role) and not is_project_manager(current_user.role):
+    if current_user.role_level < DEV_ROLE_LEVEL:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid user role"
@@ -40,8 +222,9 @@ async def require_dev_role(current_user: User = Depends(get_current_user)):
 
 
 # Backend Developer endpoints - can only access their own tasks
-@router.get("/", response_model=TaskListResponse)
-async def get_my_tasks(
+@router.get("/", response_model=None, responses={200: {"model": TaskListResponse}})
+def get_my_tasks(
+    request: Request,
     status_filter: Optional[str] = Query(None, description="Filter by task status"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
@@ -51,59 +234,44 @@ async def get_my_tasks(
     """
     Get tasks for Backend Developer (own tasks only)
     """
-    # Build query for user's own tasks
-    query = db.query(Task).filter(Task.assigned_to_id == current_user.id)
+    # Build query for user's own tasks, newest first with id breaking ties
+    stmt = select(Task).options(*TASK_LOAD_OPTIONS).where(
+        Task.assigned_to_id == current_user.id
+    ).order_by(Task.created_at.desc(), Task.id.desc())
     
     # Apply status filter if provided
     if status_filter:
-        valid_statuses = [status.value for status in TaskStatus]
-        if status_filter not in valid_statuses:
+        if status_filter not in VALID_TASK_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status. Valid options: {valid_statuses}"
+                detail=f"Invalid status. Valid options: {VALID_STATUSES_LIST}"
             )
-        query = query.filter(Task.status == status_filter)
+        stmt = stmt.where(Task.status == status_filter)
     
-    # Get total count for pagination
-    total = query.count()
-    
-    # Apply pagination and get results
-    tasks = query.offset((page - 1) * per_page).limit(per_page).all()
+    # Pages are keyed on the task revision, which every write advances, so
+    # neither the ETag nor a cached body can outlive a change
+    cache_key = _task_list_cache_key(
+        "mine", current_user.id, status_filter, page, per_page, _task_revision(db)
+    )
+    etag = _task_list_etag(cache_key)
     
-    # Convert to response format with user names
-    task_responses = []
-    for task in tasks:
-        task_response = TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            priority=task.priority,
-            created_by_id=task.created_by_id,
-            assigned_to_id=task.assigned_to_id,
-            feedback=task.feedback,
-            score=task.score,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            completed_at=task.completed_at,
-            creator_name=task.creator.full_name,
-            assignee_name=task.assignee.full_name
-        )
-        task_responses.append(task_response)
+    # Answer 304 if the client already holds this version of the page
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
     
-    total_pages = (total + per_page - 1) // per_page
+    # Serve a recently built page
+    response = _get_cached_task_list(cache_key)
+    if response is None:
+        # Apply pagination and get results
+        tasks, total = _paginate(db, stmt, page, per_page)
+        response = _cache_task_list(cache_key, _tasks_to_list_response(tasks, total, page, per_page))
     
-    return TaskListResponse(
-        tasks=task_responses,
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=total_pages
-    )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.put("/{task_id}/status", response_model=TaskResponse)
-async def update_task_status(
+def update_task_status(
     task_id: int,
     status_update: dict,
     current_user: User = Depends(require_dev_role),
@@ -112,60 +280,52 @@ async def update_task_status(
     """
     Backend Developer can update status of their own tasks
     """
-    # Get task and verify ownership
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.assigned_to_id == current_user.id
-    ).first()
-    
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found or you don't have permission to access it"
-        )
-    
     # Validate status
+    # The body is a raw dict, so a non-string status must not reach the
+    # frozenset lookup (unhashable values would raise)
     new_status = status_update.get("status")
-    valid_statuses = [status.value for status in TaskStatus]
-    
-    if new_status not in valid_statuses:
+    if not isinstance(new_status, str) or new_status not in VALID_TASK_STATUSES:
         raise HTTPException(
-            status=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Valid options: {valid_statuses}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status. Valid options: {VALID_STATUSES_LIST}"
         )
     
-    # Update status
-    task.status = new_status
+    values = {"status": new_status}
     
-    # Set completed_at if status is completed
-    if new_status == TaskStatus.COMPLETED and not task.completed_at:
+    # Set completed_at if status is completed, keeping an earlier completion time
+    if new_status == TaskStatus.COMPLETED:
         from datetime import datetime
-        task.completed_at = datetime.utcnow()
+        values["completed_at"] = func.coalesce(Task.completed_at, datetime.utcnow())
+    
+    # Update only if the task exists and is assigned to the caller
+    result = db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.assigned_to_id == current_user.id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found or you don't have permission to access it"
+        )
     
+    _bump_task_revision(db)
     db.commit()
-    db.refresh(task)
-    
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        created_by_id=task.created_by_id,
-        assigned_to_id=task.assigned_to_id,
-        feedback=task.feedback,
-        score=task.score,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        completed_at=task.completed_at,
-        creator_name=task.creator.full_name,
-        assignee_name=task.assignee.full_name
-    )
+    invalidate_task_lists()
+    
+    task = db.execute(
+        select(Task).options(*TASK_LOAD_OPTIONS).where(Task.id == task_id)
+    ).scalar_one()
+    
+    return _task_to_response(task)
 
 
 # Project Manager endpoints - full access to all tasks
-@router.get("/all", response_model=TaskListResponse)
-async def get_all_tasks(
+@router.get("/all", response_model=None, responses={200: {"model": TaskListResponse}})
+def get_all_tasks(
+    request: Request,
     status_filter: Optional[str] = Query(None, description="Filter by task status"),
     assignee_filter: Optional[int] = Query(None, description="Filter by assignee ID"),
     page: int = Query(1, ge=1, description="Page number"),
@@ -176,61 +336,50 @@ async def get_all_tasks(
     """
     Get all tasks (Project Manager only)
     """
-    query = db.query(Task)
+    # Newest first, as served by ix_tasks_status_created_at; the id breaks
+    # ties so pages do not overlap
+    stmt = select(Task).options(*TASK_LIST_LOAD_OPTIONS).order_by(
+        Task.created_at.desc(), Task.id.desc()
+    )
     
     # Apply filters
     if status_filter:
-        valid_statuses = [status.value for status in TaskStatus]
-        if status_filter not in valid_statuses:
+        if status_filter not in VALID_TASK_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status. Valid options: {valid_statuses}"
+                detail=f"Invalid status. Valid options: {VALID_STATUSES_LIST}"
             )
-        query = query.filter(Task.status == status_filter)
+        stmt = stmt.where(Task.status == status_filter)
     
     if assignee_filter:
-        query = query.filter(Task.assigned_to_id == assignee_filter)
+        stmt = stmt.where(Task.assigned_to_id == assignee_filter)
     
-    # Get total count for pagination
-    total = query.count()
-    
-    # Apply pagination and get results
-    tasks = query.offset((page - 1) * per_page).limit(per_page).all()
-    
-    # Convert to response format
-    task_responses = []
-    for task in tasks:
-        task_response = TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            priority=task.priority,
-            created_by_id=task.created_by_id,
-            assigned_to_id=task.assigned_to_id,
-            feedback=task.feedback,
-            score=task.score,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            completed_at=task.completed_at,
-            creator_name=task.creator.full_name,
-            assignee_name=task.assignee.full_name
-        )
-        task_responses.append(task_response)
-    
-    total_pages = (total + per_page - 1) // per_page
-    
-    return TaskListResponse(
-        tasks=task_responses,
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=total_pages
+    # Pages are keyed on the task revision, which every write advances, so
+    # neither the ETag nor a cached body can outlive a change
+    cache_key = _task_list_cache_key(
+        "all", status_filter, assignee_filter, page, per_page, _task_revision(db)
     )
+    etag = _task_list_etag(cache_key)
+    
+    # Answer 304 if the client already holds this version of the page
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    # Serve a recently built page; the result does not depend on which
+    # Project Manager asks
+    response = _get_cached_task_list(cache_key)
+    if response is None:
+        # Apply pagination and get results
+        tasks, total = _paginate(db, stmt, page, per_page)
+        _load_task_users(db, tasks)
+        response = _cache_task_list(cache_key, _tasks_to_list_response(tasks, total, page, per_page))
+    
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.post("/", response_model=TaskResponse)
-async def create_task(
+def create_task(
     task_data: TaskCreate,
     current_user: User = Depends(require_pm_role),
     db: Session = Depends(get_db)
@@ -238,9 +387,11 @@ async def create_task(
     """
     Create new task (Project Manager only)
     """
-    # Verify assignee exists
-    assignee = db.query(User).filter(User.id == task_data.assigned_to_id).first()
-    if not assignee:
+    # Verify assignee exists without fetching the user row
+    assignee_exists = db.execute(
+        select(exists().where(User.id == task_data.assigned_to_id))
+    ).scalar()
+    if not assignee_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assignee not found"
@@ -256,29 +407,20 @@ async def create_task(
     )
     
     db.add(db_task)
+    _bump_task_revision(db)
     db.commit()
-    db.refresh(db_task)
-    
-    return TaskResponse(
-        id=db_task.id,
-        title=db_task.title,
-        description=db_task.description,
-        status=db_task.status,
-        priority=db_task.priority,
-        created_by_id=db_task.created_by_id,
-        assigned_to_id=db_task.assigned_to_id,
-        feedback=db_task.feedback,
-        score=db_task.score,
-        created_at=db_task.created_at,
-        updated_at=db_task.updated_at,
-        completed_at=db_task.completed_at,
-        creator_name=db_task.creator.full_name,
-        assignee_name=db_task.assignee.full_name
-    )
+    invalidate_task_lists()
+    
+    # Reload with creator and assignee joined instead of refresh + two lazy loads
+    db_task = db.execute(
+        select(Task).options(*TASK_LOAD_OPTIONS).where(Task.id == db_task.id)
+    ).scalar_one()
+    
+    return _task_to_response(db_task)
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
-async def update_task(
+def update_task(
     task_id: int,
     task_update: TaskUpdate,
     current_user: User = Depends(require_pm_role),
@@ -287,24 +429,15 @@ async def update_task(
     """
     Update task details (Project Manager only)
     """
-    # Get task
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
-    
     # Update task fields
-    update_data = task_update.dict(exclude_unset=True)
+    update_data = task_update.model_dump(exclude_unset=True)
     
     # Validate status if provided
     if "status" in update_data:
-        valid_statuses = [status.value for status in TaskStatus]
-        if update_data["status"] not in valid_statuses:
+        if update_data["status"] not in VALID_TASK_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status. Valid options: {valid_statuses}"
+                detail=f"Invalid status. Valid options: {VALID_STATUSES_LIST}"
             )
     
     # Validate score if provided
@@ -316,38 +449,43 @@ async def update_task(
                 detail="Score must be between 1 and 10"
             )
     
-    # Apply updates
-    for field, value in update_data.items():
-        setattr(task, field, value)
-    
-    # Set completed_at if status is completed
-    if "status" in update_data and update_data["status"] == TaskStatus.COMPLETED and not task.completed_at:
+    # Set completed_at if status is completed, keeping an earlier completion time
+    if update_data.get("status") == TaskStatus.COMPLETED:
         from datetime import datetime
-        task.completed_at = datetime.utcnow()
+        update_data["completed_at"] = func.coalesce(Task.completed_at, datetime.utcnow())
+    
+    # Apply updates as a single UPDATE, bypassing ORM change tracking
+    if update_data:
+        result = db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**update_data)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
+        _bump_task_revision(db)
+        db.commit()
+        invalidate_task_lists()
+    
+    task = db.execute(
+        select(Task).options(*TASK_LOAD_OPTIONS).where(Task.id == task_id)
+    ).scalar_one_or_none()
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
     
-    db.commit()
-    db.refresh(task)
-    
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        created_by_id=task.created_by_id,
-        assigned_to_id=task.assigned_to_id,
-        feedback=task.feedback,
-        score=task.score,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        completed_at=task.completed_at,
-        creator_name=task.creator.full_name,
-        assignee_name=task.assignee.full_name
-    )
+    return _task_to_response(task)
 
 
 @router.delete("/{task_id}")
-async def delete_task(
+def delete_task(
     task_id: int,
     current_user: User = Depends(require_pm_role),
     db: Session = Depends(get_db)
@@ -356,7 +494,7 @@ async def delete_task(
     Delete task (Project Manager only)
     """
     # Get task
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = db.execute(select(Task).where(Task.id == task_id)).scalar_one_or_none()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -365,13 +503,15 @@ async def delete_task(
     
     # Delete task
     db.delete(task)
+    _bump_task_revision(db)
     db.commit()
+    invalidate_task_lists()
     
     return {"message": "Task deleted successfully"}
 
 
-@router.get("/{task_id}", response_model=TaskResponse)
-async def get_task_by_id(
+@router.get("/{task_id}", response_model=None, responses={200: {"model": TaskResponse}})
+def get_task_by_id(
     task_id: int,
     current_user: User = Depends(require_dev_role),
     db: Session = Depends(get_db)
@@ -380,14 +520,11 @@ async def get_task_by_id(
     Get task by ID (role-based access)
     """
     # Project Manager can access any task
-    if is_project_manager(current_user.role):
-        task = db.query(Task).filter(Task.id == task_id).first()
-    else:
+    stmt = select(Task).options(*TASK_LOAD_OPTIONS).where(Task.id == task_id)
+    if current_user.role_level < PM_ROLE_LEVEL:
         # Backend Developer can only access their own tasks
-        task = db.query(Task).filter(
-            Task.id == task_id,
-            Task.assigned_to_id == current_user.id
-        ).first()
+        stmt = stmt.where(Task.assigned_to_id == current_user.id)
+    task = db.execute(stmt).scalar_one_or_none()
     
     if not task:
         raise HTTPException(
@@ -395,19 +532,4 @@ async def get_task_by_id(
             detail="Task not found or you don't have permission to access it"
         )
     
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        created_by_id=task.created_by_id,
-        assigned_to_id=task.assigned_to_id,
-        feedback=task.feedback,
-        score=task.score,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        completed_at=task.completed_at,
-        creator_name=task.creator.full_name,
-        assignee_name=task.assignee.full_name
-    )
\ No newline at end of file
+    return ORJSONResponse(_task_to_response(task).model_dump(mode="json"))
\ No newline at end of file
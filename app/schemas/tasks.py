@@ -51,6 +51,37 @@ class TaskResponse(BaseModel):
         from_attributes = True
 
 
+def _compile_task_response_builder():
+    """
+    Generate a builder that reads each TaskResponse field straight off a
+    loaded task and fills the instance the way model_construct does, minus
+    its per-call loop over the field definitions
+    """
+    fields = list(TaskResponse.model_fields)
+    values = ", ".join(f"{name!r}: task.{name}" for name in fields)
+    source = (
+        "def build_task_response(task):\n"
+        "    response = new(TaskResponse)\n"
+        f"    setattr(response, '__dict__', {{{values}}})\n"
+        "    setattr(response, '__pydantic_fields_set__', set(fields))\n"
+        "    setattr(response, '__pydantic_extra__', None)\n"
+        "    setattr(response, '__pydantic_private__', None)\n"
+        "    return response\n"
+    )
+    namespace = {
+        "TaskResponse": TaskResponse,
+        "new": object.__new__,
+        "setattr": object.__setattr__,
+        "fields": frozenset(fields),
+    }
+    exec(source, namespace)
+    return namespace["build_task_response"]
+
+
+# Fast path for ORM tasks whose columns already match the schema types
+build_task_response = _compile_task_response_builder()
+
+
 class TaskFilter(BaseModel):
     """Task filtering parameters"""
     status: Optional[str] = None
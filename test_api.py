@@ -4,6 +4,7 @@ Demonstrates all functionality and role-based access control
 """
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional
 
 
@@ -13,25 +14,27 @@ class TaskflowAPITester:
         self.pm_token: Optional[str] = None
         self.dev_token: Optional[str] = None
         
+        # One keep-alive session so every call reuses a pooled connection
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
     def make_request(self, method: str, endpoint: str, token: Optional[str] = None, data: Dict = None) -> Dict:
         """Make HTTP request with proper headers"""
         url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"}
+        headers = {}
         
         if token:
             headers["Authorization"] = f"Bearer {token}"
         
+        method = method.upper()
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported method: {method}")
+        
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=data)
-            elif method.upper() == "PUT":
-                response = requests.put(url, headers=headers, json=data)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+            response = self._session.request(method, url, headers=headers, json=data)
             
             response.raise_for_status()
             return response.json()
@@ -263,7 +266,7 @@ def main():
     
     # Check if API is running
     try:
-        response = requests.get("http://localhost:8000/health")
+        response = tester._session.get(f"{tester.base_url}/health")
         if response.status_code != 200:
             print("❌ API is not responding correctly")
             return